@@ -1,10 +1,14 @@
+import sys
 from dataclasses import dataclass
 from typing import Callable, Dict, Optional
 
 from faker import Faker
 
+# Slotted dataclasses are only available from Python 3.10 on
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ModelFakerConfig:
     """
     Configuration for the ModelFaker class.
@@ -17,10 +21,18 @@ class ModelFakerConfig:
     :param unique_constraints: Whether to enforce unique constraints.
     :param max_retries: Maximum retries for unique constraint violations.
     :param bulk_size: Number of records to insert in a single batch.
+    :param bulk_insert: Whether create() inserts each batch with a single
+        executemany statement instead of adding the instances to the ORM
+        session. This is faster, but skips ORM validators, mapper events
+        and Python side defaults of relationships.
+    :param commit: Whether create() and create_with() commit the session.
+        If disabled, they only flush it and leave the transaction to the
+        caller.
     :param field_overrides: Custom generators for specific fields.
     :param smart_detection: Enable smart field name detection for realistic
         data.
-    :param faker_instance: Custom Faker instance to use.
+    :param faker_instance: Custom Faker instance to use. If not set, the
+        ModelFaker creates one for the locale on first use.
     """
 
     fill_nullable_fields: bool = False
@@ -30,6 +42,8 @@ class ModelFakerConfig:
     unique_constraints: bool = True
     max_retries: int = 10
     bulk_size: int = 1000
+    bulk_insert: bool = False
+    commit: bool = True
     field_overrides: Optional[Dict[str, Callable]] = None
     smart_detection: bool = True
     faker_instance: Optional[Faker] = None
@@ -37,8 +51,3 @@ class ModelFakerConfig:
     def __post_init__(self):
         if self.field_overrides is None:
             self.field_overrides = {}
-
-        if self.faker_instance is None:
-            self.faker_instance = Faker(self.locale)
-            if self.seed is not None:
-                self.faker_instance.seed_instance(self.seed)
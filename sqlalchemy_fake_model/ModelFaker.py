@@ -1,19 +1,111 @@
+import importlib
 import json
 import logging
 import random
-import traceback
-from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Union
+import time
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache, partial
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from faker import Faker
-from sqlalchemy import Column, ColumnDefault, Table
+from sqlalchemy import (
+    Column,
+    ColumnDefault,
+    ForeignKey,
+    Table,
+    create_engine,
+)
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import ColumnProperty, Session
+from sqlalchemy.orm import ColumnProperty, Session, sessionmaker
 
 from .Enum import ModelColumnTypesEnum
 from .Error import InvalidAmountError, UniquenessError
 from .Model import ModelFakerConfig
 from .SmartFieldDetector import SmartFieldDetector
+from .Utils import has_single_random
+
+_ENUM_TYPE = ModelColumnTypesEnum.ENUM.value
+_INTEGER_TYPE = ModelColumnTypesEnum.INTEGER.value
+_BOOLEAN_TYPE = ModelColumnTypesEnum.BOOLEAN.value
+_FLOAT_TYPE = ModelColumnTypesEnum.FLOAT.value
+_DATE_TYPE = ModelColumnTypesEnum.DATE.value
+_DATETIME_TYPE = ModelColumnTypesEnum.DATETIME.value
+
+_MAX_CHOICES_RANGE = 2**32
+
+_FK_POOL_SIZE = 1000
+
+# Naive like the values of Faker.date_time
+_EPOCH = datetime.fromtimestamp(0, timezone.utc).replace(tzinfo=None)
+
+_SECONDS_PER_DAY = 86400
+
+_DEFAULT_FAKERS: Dict[str, Faker] = {}
+
+# Marks the smart detector of a ModelFaker as not resolved yet, as None
+# disables smart detection
+_UNRESOLVED: Any = object()
+
+
+@lru_cache(maxsize=None)
+def _import_framework(module_name: str) -> Optional[ModuleType]:
+    """
+    Imports the module of a supported framework, or returns None if it is
+    not installed. The result is cached, so the import is only attempted
+    once per process.
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _parse_json_doc(docstring: str) -> Any:
+    """
+    Parses the JSON schema of a column docstring. The result is cached
+    and shared between all ModelFakers, so it must not be modified.
+    """
+    return json.loads(docstring)
+
+
+def _create_faker(locale: str) -> Faker:
+    """
+    Creates a Faker instance for the locale. Weighting is disabled, so
+    providers pick from their element lists with a plain random choice
+    instead of a weighted one, which is many times faster.
+    """
+    return Faker(locale, use_weighting=False)
+
+
+def _get_days_since_epoch() -> int:
+    """
+    Returns the number of whole days since the epoch. Dates and datetimes
+    are drawn up to the start of today, so seeded instances produce the
+    same values over the whole day.
+    """
+    return int(time.time() // _SECONDS_PER_DAY)
+
+
+def _get_default_faker(locale: str) -> Faker:
+    """
+    Returns the Faker instance shared by all ModelFakers of a locale
+    which neither provide their own instance nor a seed.
+    """
+    faker = _DEFAULT_FAKERS.get(locale)
+    if faker is None:
+        faker = _DEFAULT_FAKERS.setdefault(locale, _create_faker(locale))
+    return faker
 
 
 class ModelFaker:
@@ -24,6 +116,26 @@ class ModelFaker:
     between models and can generate data for different relationships.
     """
 
+    __slots__ = (
+        "_column_plan",
+        "_column_plan_key",
+        "_columns",
+        "_db",
+        "_doc_plans",
+        "_faker",
+        "_fk_pools",
+        "_is_m2m",
+        "_processing_relationships",
+        "_relationship_cache",
+        "_relationship_keys",
+        "_smart_detector",
+        "_table",
+        "_unique_values",
+        "config",
+        "logger",
+        "model",
+    )
+
     def __init__(
         self,
         model: Union[Table, ColumnProperty],
@@ -45,23 +157,94 @@ class ModelFaker:
             used for configuring the ModelFaker.
         """
         self.model = model
-        self.db = db or self._get_framework_session()
-        self.config = config or ModelFakerConfig()
-        self.faker = (
-            faker or self.config.faker_instance or Faker(self.config.locale)
+        self._is_m2m = not hasattr(model, "__table__") and not hasattr(
+            model, "__mapper__"
         )
+        self._table = model if self._is_m2m else model.__table__
+        self._columns = tuple(self._table.columns)
+        self._relationship_keys = (
+            frozenset()
+            if self._is_m2m
+            else frozenset(model.__mapper__.relationships.keys())
+        )
+        self._db = db
+        self.config = config or ModelFakerConfig()
+        self._faker = faker
         self.logger = logging.getLogger(__name__)
         self._unique_values = {}
         self._relationship_cache = {}
+        self._fk_pools = {}
         self._processing_relationships = set()
-        self.smart_detector = (
-            SmartFieldDetector(self.faker)
-            if self.config.smart_detection
-            else None
-        )
+        self._column_plan = None
+        self._column_plan_key = None
+        self._doc_plans = {}
+        self._smart_detector = _UNRESOLVED
 
-        if self.config.seed is not None:
-            self.faker.seed_instance(self.config.seed)
+        if faker is not None and self.config.seed is not None:
+            faker.seed_instance(self.config.seed)
+
+    @property
+    def db(self) -> Session:
+        """
+        The SQLAlchemy session, resolved from the supported frameworks on
+        first access if none was provided.
+        """
+        if self._db is None:
+            self._db = self._get_framework_session()
+        return self._db
+
+    @db.setter
+    def db(self, db: Optional[Session]) -> None:
+        self._db = db
+        self._fk_pools = {}
+
+    @property
+    def faker(self) -> Faker:
+        """
+        The Faker instance, resolved on first access if none was provided,
+        as creating it initializes all of its providers. Unseeded instances
+        share one Faker per locale.
+        """
+        if self._faker is None:
+            if self.config.faker_instance is not None:
+                self._faker = self.config.faker_instance
+            elif self.config.seed is not None:
+                # Seeded instances get their own Faker, so seeding does not
+                # change the values of other ModelFakers
+                self._faker = _create_faker(self.config.locale)
+            else:
+                self._faker = _get_default_faker(self.config.locale)
+
+            if self.config.seed is not None:
+                self._faker.seed_instance(self.config.seed)
+        return self._faker
+
+    @faker.setter
+    def faker(self, faker: Optional[Faker]) -> None:
+        # The smart detector and the generators bind the previous instance
+        self._faker = faker
+        if self._smart_detector is not None:
+            self._smart_detector = _UNRESOLVED
+        self._column_plan = None
+        self._doc_plans = {}
+
+    @property
+    def smart_detector(self) -> Optional[SmartFieldDetector]:
+        """
+        The smart field detector, or None if smart detection is disabled.
+        """
+        if self._smart_detector is _UNRESOLVED:
+            if not self.config.smart_detection:
+                return None
+            self._smart_detector = SmartFieldDetector(self.faker)
+        return self._smart_detector
+
+    @smart_detector.setter
+    def smart_detector(
+        self, smart_detector: Optional[SmartFieldDetector]
+    ) -> None:
+        self._smart_detector = smart_detector
+        self._column_plan = None
 
     def __enter__(self):
         """Context manager entry."""
@@ -71,9 +254,9 @@ class ModelFaker:
         """Context manager exit with automatic cleanup."""
         if exc_type is not None:
             self.logger.error(f"Exception in ModelFaker context: {exc_val}")
-            if hasattr(self.db, "rollback"):
+            if hasattr(self._db, "rollback"):
                 try:
-                    self.db.rollback()
+                    self._db.rollback()
                     self.logger.info("Database transaction rolled back")
                 except Exception as rollback_error:
                     self.logger.error(f"Failed to rollback: {rollback_error}")
@@ -88,40 +271,42 @@ class ModelFaker:
         :raises RuntimeError: If no supported framework
             is installed or configured
         """
-        try:
-            from flask import current_app
-
-            if "sqlalchemy" in current_app.extensions:
-                db_ext = current_app.extensions["sqlalchemy"]
-
-                # In Flask-SQLAlchemy >= 2.0, the db object is the extension
-                # itself
-                if hasattr(db_ext, "session"):
-                    return db_ext.session
+        flask = _import_framework("flask")
+        if flask is not None:
+            try:
+                current_app = flask.current_app
 
-                # Some versions might have a different structure
-                if hasattr(db_ext, "db") and hasattr(db_ext.db, "session"):
-                    return db_ext.db.session
+                if "sqlalchemy" in current_app.extensions:
+                    db_ext = current_app.extensions["sqlalchemy"]
 
-        except (ImportError, KeyError, AttributeError):
-            pass
+                    # In Flask-SQLAlchemy >= 2.0, the db object is the
+                    # extension itself
+                    if hasattr(db_ext, "session"):
+                        return db_ext.session
 
-        try:
-            from tornado.web import Application
+                    # Some versions might have a different structure
+                    if hasattr(db_ext, "db") and hasattr(db_ext.db, "session"):
+                        return db_ext.db.session
 
-            return Application().settings["db"]
-        except (ImportError, KeyError):
-            pass
+            except (KeyError, AttributeError):
+                pass
 
-        try:
-            from django.conf import settings
-            from sqlalchemy import create_engine
-            from sqlalchemy.orm import sessionmaker
+        tornado_web = _import_framework("tornado.web")
+        if tornado_web is not None:
+            try:
+                return tornado_web.Application().settings["db"]
+            except KeyError:
+                pass
 
-            engine = create_engine(settings.DATABASES["default"]["ENGINE"])
-            return sessionmaker(bind=engine)()
-        except (ImportError, KeyError, AttributeError):
-            pass
+        django_conf = _import_framework("django.conf")
+        if django_conf is not None:
+            try:
+                engine = create_engine(
+                    django_conf.settings.DATABASES["default"]["ENGINE"]
+                )
+                return sessionmaker(bind=engine)()
+            except (KeyError, AttributeError):
+                pass
 
         raise RuntimeError(
             "No SQLAlchemy session provided and no supported framework "
@@ -141,6 +326,8 @@ class ModelFaker:
         if not isinstance(amount, int) or amount < 0:
             raise InvalidAmountError(amount)
 
+        self._fk_pools.clear()
+
         if amount <= self.config.bulk_size:
             self._create_single_batch(amount)
         else:
@@ -155,25 +342,12 @@ class ModelFaker:
 
         while retries < max_retries:
             try:
-                batch_data = []
-
-                for _ in range(amount):
-                    data = {}
-                    for column in self.__get_table_columns():
-                        if self.__should_skip_field(column):
-                            continue
-                        data[column.name] = (
-                            self._generate_fake_data_with_overrides(column)
-                        )
-                    batch_data.append(data)
+                batch_data = self.__generate_rows(amount)
 
-                if self.__is_many_to_many_relation_table():
-                    self.db.execute(self.model.insert().values(batch_data))
-                else:
-                    for data in batch_data:
-                        self.db.add(self.model(**data))
+                if batch_data:
+                    self.__insert_rows(batch_data)
 
-                self.db.commit()
+                self.__commit()
                 self.logger.info(f"Successfully created {amount} records")
                 return
 
@@ -202,9 +376,28 @@ class ModelFaker:
                     e, (IntegrityError, UniquenessError, InvalidAmountError)
                 ):
                     raise
-                raise RuntimeError(
-                    f"Failed to commit: {e} {traceback.format_exc()}"
-                ) from e
+                raise RuntimeError(f"Failed to commit: {e}") from e
+
+    def __commit(self) -> None:
+        """
+        Commits the session, or only flushes it if commits are disabled.
+        """
+        if self.config.commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+
+    def __insert_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Inserts the rows with a single executemany statement, or adds them
+        as instances to the session if bulk inserts are disabled.
+        Many-to-many tables have no model, so they are always inserted
+        directly.
+        """
+        if self.config.bulk_insert or self.__is_many_to_many_relation_table():
+            self.db.execute(self.__get_table().insert(), rows)
+        else:
+            self.db.add_all([self.model(**data) for data in rows])
 
     def _create_bulk(self, amount: int) -> None:
         """Creates records in multiple batches for better performance."""
@@ -236,117 +429,285 @@ class ModelFaker:
             needs to be generated.
         :return: The fake data generated for the column.
         """
+        return self._build_fake_data_generator(column)()
+
+    def _build_fake_data_generator(self, column: Column) -> Callable[[], Any]:
+        """
+        Builds a generator for a given column based on its type. The type
+        of the column is resolved once, so calling the returned generator
+        only produces the fake value.
+
+        :param column: The SQLAlchemy column for which fake data
+            needs to be generated.
+        :return: A callable without arguments returning the fake data.
+        """
         column_type = column.type
 
         if column.doc:
-            return json.dumps(self._generate_json_data(column.doc))
+            generate_json_data = self.__get_doc_plan(column.doc)
+            return lambda: json.dumps(generate_json_data())
 
         # Enum has to be the first type to check, or otherwise it
         # uses the options of the corresponding type of the enum options
-        if isinstance(column_type, ModelColumnTypesEnum.ENUM.value):
-            return random.choice(column_type.enums)
+        if isinstance(column_type, _ENUM_TYPE):
+            options = tuple(column_type.enums)
+            faker = self.faker
+            if has_single_random(faker):
+                return lambda: faker.random.choice(options)
+            return lambda: random.choice(options)
 
         if column.foreign_keys:
-            related_attribute = next(iter(column.foreign_keys)).column.name
-            return getattr(
-                self.__handle_relationship(column), related_attribute
+            fk = next(iter(column.foreign_keys))
+            parent_model = self.__get_related_class(column, fk)
+            related_column = fk.column
+            return lambda: self.__get_related_value(
+                parent_model, related_column
             )
 
         if column.primary_key:
-            return self._generate_primitive(column_type)
-
-        if isinstance(column_type, ModelColumnTypesEnum.STRING.value):
-            max_length = (
-                column_type.length
-                if hasattr(column_type, "length")
-                and column_type.length is not None
-                else 255
-            )
-            return self.faker.text(max_nb_chars=max_length)
+            return lambda: self._generate_primitive(column_type)
 
-        if isinstance(column_type, ModelColumnTypesEnum.TEXT.value):
-            return self.faker.text(max_nb_chars=500)
+        build_generator = self._resolve_type_generator_builder(
+            type(column_type)
+        )
+        if build_generator is None:
+            return lambda: None
 
-        if isinstance(column_type, ModelColumnTypesEnum.INTEGER.value):
-            info = column.info
-            if not info:
-                return self.faker.random_int()
+        return build_generator(self, column)
 
-            min_value = column.info.get("min", 1)
-            max_value = column.info.get("max", 100)
-            return self.faker.random_int(min=min_value, max=max_value)
+    @classmethod
+    def _resolve_type_generator_builder(
+        cls, type_class: type
+    ) -> Optional[Callable[["ModelFaker", Column], Callable[[], Any]]]:
+        """
+        Resolves the generator builder of a column type class. The most
+        specific type wins, so subclasses like Text get their own generator
+        instead of the one of String. The resolution is cached per type
+        class for all instances.
+        """
+        if type_class in cls._TYPE_GENERATOR_BUILDER_CACHE:
+            return cls._TYPE_GENERATOR_BUILDER_CACHE[type_class]
 
-        if isinstance(column_type, ModelColumnTypesEnum.FLOAT.value):
-            precision = column_type.precision
-            if not precision:
-                return self.faker.pyfloat()
+        build_generator = next(
+            (
+                cls._TYPE_GENERATOR_BUILDERS[base_class]
+                for base_class in type_class.__mro__
+                if base_class in cls._TYPE_GENERATOR_BUILDERS
+            ),
+            None,
+        )
+        cls._TYPE_GENERATOR_BUILDER_CACHE[type_class] = build_generator
+        return build_generator
+
+    def __build_string_generator(self, column: Column) -> Callable[[], Any]:
+        """Builds the generator for String columns."""
+        faker = self.faker
+        max_length = getattr(column.type, "length", None) or 255
+        return lambda: faker.text(max_nb_chars=max_length)
+
+    def __build_text_generator(self, column: Column) -> Callable[[], Any]:
+        """Builds the generator for Text columns."""
+        faker = self.faker
+        max_length = getattr(column.type, "length", None) or 500
+        return lambda: faker.text(max_nb_chars=max_length)
+
+    def __build_integer_generator(self, column: Column) -> Callable[[], Any]:
+        """Builds the generator for Integer columns."""
+        faker = self.faker
+        min_value, max_value = self.__get_integer_range(column)
+        return lambda: faker.random_int(min=min_value, max=max_value)
 
-            max_value = 10 ** (precision[0] - precision[1]) - 1
-            return round(
-                self.faker.pyfloat(min_value=0, max_value=max_value),
-                precision[1],
-            )
+    @staticmethod
+    def __get_integer_range(column: Column) -> Tuple[int, int]:
+        """
+        Returns the range of an integer column, defined by the min and max
+        values of its info, or the default range of Faker without info.
+        """
+        info = column.info
+        if not info:
+            return 0, 9999
 
-        if isinstance(column_type, ModelColumnTypesEnum.BOOLEAN.value):
-            return self.faker.boolean()
+        return info.get("min", 1), info.get("max", 100)
 
-        if isinstance(column_type, ModelColumnTypesEnum.DATE.value):
-            return self.faker.date_object()
+    def __build_float_generator(self, column: Column) -> Callable[[], Any]:
+        """
+        Builds the generator for Float columns. With a precision, it draws
+        the value as an integer of all digits and shifts it by the scale.
+        """
+        faker = self.faker
+        float_range = self.__get_float_range(column)
+        if float_range is None:
+            return faker.pyfloat
 
-        if isinstance(column_type, ModelColumnTypesEnum.DATETIME.value):
-            return self.faker.date_time()
+        max_units, divisor = float_range
+        if not has_single_random(faker):
+            return lambda: faker.random_int(max=max_units) / divisor
 
-        if isinstance(column_type, ModelColumnTypesEnum.TIME.value):
-            return self.faker.time_object()
+        return lambda: faker.random.randint(0, max_units) / divisor
 
-        if isinstance(column_type, ModelColumnTypesEnum.UUID.value):
-            return self.faker.uuid4()
+    @staticmethod
+    def __get_float_range(column: Column) -> Optional[Tuple[int, int]]:
+        """
+        Returns the largest value of a float column with a precision and
+        scale tuple in units of its scale, and the divisor to turn units
+        into the value, or None if the column has no such precision.
+        """
+        precision = column.type.precision
+        if not isinstance(precision, tuple):
+            return None
 
-        if isinstance(column_type, ModelColumnTypesEnum.DECIMAL.value):
-            precision = getattr(column_type, "precision", None)
-            scale = getattr(column_type, "scale", None)
-            if precision and scale:
-                max_digits = precision - scale
-                max_value = 10**max_digits - 1
-                return round(
-                    self.faker.pyfloat(min_value=0, max_value=max_value), scale
-                )
-            return self.faker.pydecimal(
-                left_digits=10, right_digits=2, positive=True
-            )
+        divisor = 10 ** precision[1]
+        return (10 ** (precision[0] - precision[1]) - 1) * divisor, divisor
 
-        if isinstance(column_type, ModelColumnTypesEnum.INTERVAL.value):
-            days = self.faker.random_int(min=1, max=365)
-            return f"{days} days"
+    def __build_boolean_generator(self, column: Column) -> Callable[[], Any]:
+        """Builds the generator for Boolean columns."""
+        return self.faker.boolean
 
-        if isinstance(column_type, ModelColumnTypesEnum.LARGEBINARY.value):
-            return self.faker.binary(length=256)
+    def __build_date_generator(self, column: Column) -> Callable[[], Any]:
+        """
+        Builds the generator for Date columns, which draws a day between
+        the epoch and today like Faker.date_object.
+        """
+        faker = self.faker
+        if not has_single_random(faker):
+            return faker.date_object
+
+        first_day = _EPOCH.toordinal()
+        last_day = first_day + _get_days_since_epoch()
+        return lambda: date.fromordinal(
+            faker.random.randint(first_day, last_day)
+        )
 
-        if isinstance(
-            column_type,
-            (
-                ModelColumnTypesEnum.JSON.value,
-                ModelColumnTypesEnum.JSONB.value,
-            ),
-        ):
-            if column.doc:
-                return self._generate_json_data(column.doc)
-            json_structure = {
-                "id": "integer",
-                "name": "string",
-                "active": "boolean",
-            }
-            return self._populate_json_structure(json_structure)
+    def __build_datetime_generator(self, column: Column) -> Callable[[], Any]:
+        """
+        Builds the generator for DateTime columns, which draws a moment
+        between the epoch and today like Faker.date_time.
+        """
+        faker = self.faker
+        if not has_single_random(faker):
+            return faker.date_time
 
-        return None
+        seconds = _get_days_since_epoch() * _SECONDS_PER_DAY
+        return lambda: (
+            _EPOCH + timedelta(seconds=faker.random.uniform(0, seconds))
+        )
+
+    def __build_time_generator(self, column: Column) -> Callable[[], Any]:
+        """Builds the generator for Time columns."""
+        faker = self.faker
+        if not has_single_random(faker):
+            return faker.time_object
+
+        return lambda: (
+            _EPOCH
+            + timedelta(seconds=faker.random.uniform(0, _SECONDS_PER_DAY))
+        ).time()
+
+    def __build_uuid_generator(self, column: Column) -> Callable[[], Any]:
+        """Builds the generator for UUID columns."""
+        return self.faker.uuid4
+
+    def __build_decimal_generator(self, column: Column) -> Callable[[], Any]:
+        """Builds the generator for DECIMAL columns."""
+        faker = self.faker
+        precision = getattr(column.type, "precision", None)
+        scale = getattr(column.type, "scale", None)
+        if precision and scale:
+            max_digits = precision - scale
+            max_value = 10**max_digits - 1
+            return lambda: round(
+                faker.pyfloat(min_value=0, max_value=max_value), scale
+            )
+        return lambda: faker.pydecimal(
+            left_digits=10, right_digits=2, positive=True
+        )
 
-    def __handle_relationship(self, column: Column) -> Any:
+    def __build_interval_generator(self, column: Column) -> Callable[[], Any]:
+        """Builds the generator for Interval columns."""
+        faker = self.faker
+        return lambda: f"{faker.random_int(min=1, max=365)} days"
+
+    def __build_binary_generator(self, column: Column) -> Callable[[], Any]:
+        """Builds the generator for LargeBinary columns."""
+        faker = self.faker
+        return lambda: faker.binary(length=256)
+
+    def __build_json_generator(self, column: Column) -> Callable[[], Any]:
+        """Builds the generator for JSON columns."""
+        json_structure = {
+            "id": "integer",
+            "name": "string",
+            "active": "boolean",
+        }
+        return self._compile_json_structure(json_structure)
+
+    _TYPE_GENERATOR_BUILDERS: ClassVar[
+        Dict[type, Callable[["ModelFaker", Column], Callable[[], Any]]]
+    ] = {
+        ModelColumnTypesEnum.STRING.value: __build_string_generator,
+        ModelColumnTypesEnum.TEXT.value: __build_text_generator,
+        ModelColumnTypesEnum.INTEGER.value: __build_integer_generator,
+        ModelColumnTypesEnum.FLOAT.value: __build_float_generator,
+        ModelColumnTypesEnum.BOOLEAN.value: __build_boolean_generator,
+        ModelColumnTypesEnum.DATE.value: __build_date_generator,
+        ModelColumnTypesEnum.DATETIME.value: __build_datetime_generator,
+        ModelColumnTypesEnum.TIME.value: __build_time_generator,
+        ModelColumnTypesEnum.UUID.value: __build_uuid_generator,
+        ModelColumnTypesEnum.DECIMAL.value: __build_decimal_generator,
+        ModelColumnTypesEnum.INTERVAL.value: __build_interval_generator,
+        ModelColumnTypesEnum.LARGEBINARY.value: __build_binary_generator,
+        ModelColumnTypesEnum.JSON.value: __build_json_generator,
+        ModelColumnTypesEnum.JSONB.value: __build_json_generator,
+    }
+
+    _TYPE_GENERATOR_BUILDER_CACHE: ClassVar[
+        Dict[
+            type,
+            Optional[Callable[["ModelFaker", Column], Callable[[], Any]]],
+        ]
+    ] = {}
+
+    def __get_related_value(
+        self, parent_model: Any, related_column: Column
+    ) -> Any:
+        """
+        Returns a random value of the related records referenced by a foreign
+        key column. The existing values are loaded with a single query per
+        foreign key target and creation call, and a related record is only
+        created if there is none yet.
+        """
+        pool = self._fk_pools.get(related_column)
+
+        if pool is None:
+            pool = [
+                value
+                for (value,) in self.db.query(related_column)
+                .order_by(related_column)
+                .limit(_FK_POOL_SIZE)
+                .all()
+            ]
+            if not pool:
+                pool = [
+                    getattr(
+                        self.__handle_relationship(parent_model),
+                        related_column.name,
+                    )
+                ]
+            self._fk_pools[related_column] = pool
+
+        # Ordered pools and the random instance of Faker keep seeded runs
+        # reproducible
+        faker = self.faker
+        if has_single_random(faker):
+            return faker.random.choice(pool)
+        return random.choice(pool)
+
+    def __handle_relationship(self, parent_model: Any) -> Any:
         """
         Handles the relationship of a column with another model.
         It creates a fake data entry for the parent model and returns its id.
         Reuses existing records when possible to avoid duplicates.
         """
-        parent_model = self.__get_related_class(column)
         model_key = (
             parent_model.__name__
             if hasattr(parent_model, "__name__")
@@ -367,7 +728,10 @@ class ModelFaker:
                     self._relationship_cache[model_key] = existing_record
                 else:
                     ModelFaker(
-                        parent_model, self.db, config=self.config
+                        parent_model,
+                        self.db,
+                        faker=self.faker,
+                        config=self.config,
                     ).create()
                     self._relationship_cache[model_key] = self.db.query(
                         parent_model
@@ -388,18 +752,19 @@ class ModelFaker:
         """
         Checks if the model is a many-to-many relationship table.
         """
-        return not hasattr(self.model, "__table__") and not hasattr(
-            self.model, "__mapper__"
-        )
+        return self._is_m2m
 
     def __should_skip_field(self, column: Column) -> bool:
         """
-        Checks if a column is a primary key or has a default value.
+        Checks if a column is nullable, has a default value or is an
+        autoincrement primary key. The cheapest checks come first, and the
+        result is only evaluated once per column when building the column
+        plan.
         """
         return (
-            (column.primary_key and self.__is_field_auto_increment(column))
+            self.__is_field_nullable(column)
             or self.__has_field_default_value(column)
-            or self.__is_field_nullable(column)
+            or (column.primary_key and self.__is_field_auto_increment(column))
         )
 
     @staticmethod
@@ -407,9 +772,7 @@ class ModelFaker:
         """
         Checks if a column is autoincrement.
         """
-        return column.autoincrement and isinstance(
-            column.type, ModelColumnTypesEnum.INTEGER.value
-        )
+        return column.autoincrement and isinstance(column.type, _INTEGER_TYPE)
 
     def __has_field_default_value(self, column: Column) -> bool:
         """
@@ -431,40 +794,79 @@ class ModelFaker:
             and not self.config.fill_nullable_fields
         )
 
-    def __get_table_columns(self) -> List[Column]:
+    def __get_table(self) -> Table:
+        """
+        Returns the underlying table of the model.
+        """
+        return self._table
+
+    def __get_table_columns(self) -> Tuple[Column, ...]:
         """
         Returns the columns of the model's table.
         """
-        return (
-            self.model.columns
-            if self.__is_many_to_many_relation_table()
-            else self.model.__table__.columns
-        )
+        return self._columns
 
-    def __get_related_class(self, column: Column) -> Any:
+    def __get_related_class(self, column: Column, fk: ForeignKey) -> Any:
         """
         Returns the related class of a column if it has
         a relationship with another model.
         """
-        if (
-            not self.__is_many_to_many_relation_table()
-            and column.name in self.model.__mapper__.relationships
-        ):
+        if column.name in self._relationship_keys:
             return self.model.__mapper__.relationships[
                 column.key
             ].mapper.class_
 
-        fk = next(iter(column.foreign_keys))
-
         return fk.column.table
 
     def _generate_json_data(self, docstring: str) -> Dict[str, Any]:
         """
         Generates JSON data based on the provided docstring.
         """
-        json_structure = json.loads(docstring)
+        return self.__get_doc_plan(docstring)()
+
+    def __get_doc_plan(self, docstring: str) -> Callable[[], Any]:
+        """
+        Returns the compiled generator of a JSON docstring. The docstring
+        is only parsed and compiled on first use.
+        """
+        doc_plan = self._doc_plans.get(docstring)
+        if doc_plan is None:
+            doc_plan = self._compile_json_structure(_parse_json_doc(docstring))
+            self._doc_plans[docstring] = doc_plan
+        return doc_plan
 
-        return self._populate_json_structure(json_structure)
+    def _compile_json_structure(
+        self, structure: Union[Dict[str, Any], List[Any]]
+    ) -> Callable[[], Any]:
+        """
+        Compiles the JSON structure into a generator, which populates it
+        with fake data based on the defined schema without inspecting the
+        structure again.
+        """
+        if isinstance(structure, dict):
+            items = [
+                (key, self.__compile_json_value(value))
+                for key, value in structure.items()
+            ]
+            return lambda: {key: generate() for key, generate in items}
+
+        if isinstance(structure, list):
+            items = [self.__compile_json_value(item) for item in structure]
+            return lambda: [generate() for generate in items]
+
+        return lambda: structure
+
+    def __compile_json_value(self, value: Any) -> Callable[[], Any]:
+        """
+        Compiles a single value of a JSON structure into a generator.
+        """
+        if isinstance(value, (dict, list)):
+            return self._compile_json_structure(value)
+
+        generate_primitive = self._PRIMITIVE_DISPATCH.get(
+            value, self._PRIMITIVE_DISPATCH["string"]
+        )
+        return partial(generate_primitive, self.faker)
 
     def _populate_json_structure(
         self, structure: Union[Dict[str, Any], List[Any]]
@@ -473,37 +875,199 @@ class ModelFaker:
         Populates the JSON structure with fake data based on the defined
         schema.
         """
-        if isinstance(structure, dict):
-            return {
-                key: self._populate_json_structure(value)
-                if isinstance(value, (dict, list))
-                else self._generate_primitive(value)
-                for key, value in structure.items()
-            }
+        return self._compile_json_structure(structure)()
 
-        if isinstance(structure, list):
-            return [
-                self._populate_json_structure(item)
-                if isinstance(item, (dict, list))
-                else self._generate_primitive(item)
-                for item in structure
+    def __get_column_plan(
+        self,
+    ) -> Tuple[
+        Tuple[str, ...],
+        Tuple[Callable[[], Any], ...],
+        Tuple[Callable[[int], List[Any]], ...],
+    ]:
+        """
+        Returns the generation plan of the model as parallel tuples of the
+        column names, their generators for a single value and for a batch
+        of values. The plan is kept until the config values it depends on
+        change, so the columns only get inspected once instead of for every
+        row.
+        """
+        config = self.config
+        smart_detector = (
+            self.smart_detector if config.smart_detection else None
+        )
+        plan_key = (
+            tuple(config.field_overrides.items()),
+            config.fill_nullable_fields,
+            config.fill_default_fields,
+            smart_detector,
+        )
+        if self._column_plan is None or self._column_plan_key != plan_key:
+            plan = [
+                (
+                    column.name,
+                    *self.__build_column_generators(column, smart_detector),
+                )
+                for column in self.__get_table_columns()
+                if not self.__should_skip_field(column)
             ]
+            self._column_plan = tuple(zip(*plan)) if plan else ((), (), ())
+            self._column_plan_key = plan_key
+        return self._column_plan
 
-        return structure
-
-    def _generate_fake_data_with_overrides(self, column: Column) -> Any:
+    def __build_column_generators(
+        self, column: Column, smart_detector: Optional[SmartFieldDetector]
+    ) -> Tuple[Callable[[], Any], Callable[[int], List[Any]]]:
         """
-        Generates fake data with custom overrides and optional smart detection.
+        Builds the generators of a column with custom overrides and optional
+        smart detection.
+
+        :param column: The column to build the generators for
+        :param smart_detector: The smart detector to use, or None if smart
+            detection is disabled
         """
         if column.name in self.config.field_overrides:
-            return self.config.field_overrides[column.name]()
+            generate = self.config.field_overrides[column.name]
+            return generate, self.__repeat_generator(generate)
+
+        # Columns with a JSON schema in their docstring always follow it,
+        # so smart detection cannot turn their value into plain text
+        if smart_detector and not column.doc:
+            smart_generator = smart_detector.get_generator(column)
+            if smart_generator is not None:
+                return smart_generator, self.__repeat_generator(
+                    smart_generator
+                )
+
+        generator = self._build_fake_data_generator(column)
+        batch_generator = self._build_fake_data_batch_generator(column)
+        return generator, (
+            batch_generator or self.__repeat_generator(generator)
+        )
+
+    @staticmethod
+    def __repeat_generator(
+        generate: Callable[[], Any],
+    ) -> Callable[[int], List[Any]]:
+        """
+        Wraps a generator for a single value into a batch generator.
+        """
+        return lambda amount: [generate() for _ in range(amount)]
+
+    def _build_fake_data_batch_generator(
+        self, column: Column
+    ) -> Optional[Callable[[int], List[Any]]]:
+        """
+        Builds a generator drawing the values of a whole batch at once for
+        columns which only need random numbers. It uses the random instance
+        of Faker directly, so seeded instances stay reproducible.
+
+        :param column: The SQLAlchemy column for which fake data
+            needs to be generated.
+        :return: A callable taking the amount and returning the values, or
+            None if the column needs to be generated value by value.
+        """
+        column_type = column.type
+
+        if column.doc or column.foreign_keys or column.primary_key:
+            return None
+
+        faker = self.faker
+
+        if not has_single_random(faker):
+            return None
+
+        if isinstance(column_type, _ENUM_TYPE):
+            options = tuple(column_type.enums)
+            return lambda amount: faker.random.choices(options, k=amount)
+
+        if isinstance(column_type, _INTEGER_TYPE):
+            min_value, max_value = self.__get_integer_range(column)
+            values = range(min_value, max_value + 1)
+
+            # Random.choices draws all values in a single loop, but picks
+            # them by scaling a float, which is only uniform for ranges
+            # that fit into its precision
+            if 0 < max_value - min_value + 1 <= _MAX_CHOICES_RANGE:
+                return lambda amount: faker.random.choices(values, k=amount)
+
+            def generate_integers(amount: int) -> List[int]:
+                randrange = faker.random.randrange
+                return [
+                    randrange(min_value, max_value + 1) for _ in range(amount)
+                ]
+
+            return generate_integers
+
+        if isinstance(column_type, _FLOAT_TYPE):
+            float_range = self.__get_float_range(column)
+            if float_range is None or float_range[0] >= _MAX_CHOICES_RANGE:
+                return None
+
+            max_units, divisor = float_range
+            units = range(max_units + 1)
+            return lambda amount: [
+                value / divisor
+                for value in faker.random.choices(units, k=amount)
+            ]
+
+        if isinstance(column_type, _BOOLEAN_TYPE):
+
+            def generate_booleans(amount: int) -> List[bool]:
+                rand = faker.random.random
+                return [rand() < 0.5 for _ in range(amount)]
+
+            return generate_booleans
+
+        if isinstance(column_type, _DATE_TYPE):
+            first_day = _EPOCH.toordinal()
+            days = range(first_day, first_day + _get_days_since_epoch() + 1)
+            return lambda amount: list(
+                map(date.fromordinal, faker.random.choices(days, k=amount))
+            )
 
-        if self.smart_detector:
-            smart_value = self.smart_detector.detect_and_generate(column)
-            if smart_value is not None:
-                return smart_value
+        if isinstance(column_type, _DATETIME_TYPE):
+            seconds = _get_days_since_epoch() * _SECONDS_PER_DAY
 
-        return self._generate_fake_data(column)
+            def generate_datetimes(amount: int) -> List[datetime]:
+                rand = faker.random.random
+                return [
+                    _EPOCH + timedelta(seconds=rand() * seconds)
+                    for _ in range(amount)
+                ]
+
+            return generate_datetimes
+
+        return None
+
+    def _make_row(self) -> Dict[str, Any]:
+        """
+        Generates the data of a single row without inserting it.
+
+        :return: The generated values by column name.
+        """
+        return self.__generate_rows(1)[0]
+
+    def __generate_rows(self, amount: int) -> List[Dict[str, Any]]:
+        """
+        Generates the data of multiple rows following the column plan.
+        The values are generated column by column, so columns with a
+        batch generator draw all of their values at once.
+        """
+        names, _, batch_generators = self.__get_column_plan()
+        if not names:
+            return [{} for _ in range(amount)]
+
+        values = [generate_many(amount) for generate_many in batch_generators]
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+    _PRIMITIVE_DISPATCH: ClassVar[Dict[str, Callable[[Faker], Any]]] = {
+        "boolean": lambda faker: faker.boolean(),
+        "datetime": lambda faker: faker.date_time().isoformat(),
+        "date": lambda faker: faker.date(),
+        "integer": lambda faker: faker.random_int(),
+        "string": lambda faker: faker.word(),
+        "float": lambda faker: faker.pyfloat(),
+    }
 
     def _generate_primitive(
         self, primitive_type: str
@@ -511,19 +1075,9 @@ class ModelFaker:
         """
         Generates fake data for primitive types.
         """
-        if primitive_type == "boolean":
-            return self.faker.boolean()
-        if primitive_type == "datetime":
-            return self.faker.date_time().isoformat()
-        if primitive_type == "date":
-            return self.faker.date()
-        if primitive_type == "integer":
-            return self.faker.random_int()
-        if primitive_type == "string":
-            return self.faker.word()
-        if primitive_type == "float":
-            return self.faker.pyfloat()
-        return self.faker.word()
+        return self._PRIMITIVE_DISPATCH.get(
+            primitive_type, self._PRIMITIVE_DISPATCH["string"]
+        )(self.faker)
 
     def create_batch(self, amount: int, commit: bool = False) -> List[Any]:
         """
@@ -536,17 +1090,11 @@ class ModelFaker:
         if not isinstance(amount, int):
             raise InvalidAmountError(amount)
 
+        self._fk_pools.clear()
+
         instances = []
         try:
-            for _ in range(amount):
-                data = {}
-                for column in self.__get_table_columns():
-                    if self.__should_skip_field(column):
-                        continue
-                    data[column.name] = (
-                        self._generate_fake_data_with_overrides(column)
-                    )
-
+            for data in self.__generate_rows(amount):
                 if not self.__is_many_to_many_relation_table():
                     instance = self.model(**data)
                     instances.append(instance)
@@ -584,20 +1132,36 @@ class ModelFaker:
         if not isinstance(amount, int):
             raise InvalidAmountError(amount)
 
+        self._fk_pools.clear()
+
         instances = []
         try:
+            names, generators, _ = self.__get_column_plan()
+
+            # The overrides are merged into the plan once, so the rows only
+            # call the generators of the remaining columns
+            fixed_data = {
+                name: overrides[name] for name in names if name in overrides
+            }
+            remaining_generators = [
+                (name, generate)
+                for name, generate in zip(names, generators)
+                if name not in overrides
+            ]
+
+            unknown_fields = set(overrides).difference(
+                column.name for column in self.__get_table_columns()
+            )
+            if unknown_fields:
+                self.logger.warning(
+                    f"Ignoring overrides for unknown fields: {unknown_fields}"
+                )
+
             for _ in range(amount):
-                data = {}
-                for column in self.__get_table_columns():
-                    if self.__should_skip_field(column):
-                        continue
-
-                    if column.name in overrides:
-                        data[column.name] = overrides[column.name]
-                    else:
-                        data[column.name] = (
-                            self._generate_fake_data_with_overrides(column)
-                        )
+                data = {
+                    name: generate() for name, generate in remaining_generators
+                }
+                data.update(fixed_data)
 
                 if self.__is_many_to_many_relation_table():
                     self.db.execute(self.model.insert().values(**data))
@@ -606,7 +1170,7 @@ class ModelFaker:
                     instances.append(instance)
                     self.db.add(instance)
 
-            self.db.commit()
+            self.__commit()
             self.logger.info(
                 f"Created {len(instances)} instances with overrides"
             )
@@ -632,11 +1196,10 @@ class ModelFaker:
             raise ValueError("Must set confirm=True to delete all records")
 
         try:
-            if self.__is_many_to_many_relation_table():
-                result = self.db.execute(self.model.delete())
-                deleted_count = result.rowcount
-            else:
-                deleted_count = self.db.query(self.model).delete()
+            # A single DELETE on the table, which skips the synchronization
+            # of the ORM query, as all instances get expired on commit anyway
+            result = self.db.execute(self.__get_table().delete())
+            deleted_count = result.rowcount
 
             self.db.commit()
             self.logger.info(
@@ -1,9 +1,231 @@
-from typing import Any, Optional
+import re
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from faker import Faker
 from sqlalchemy import Column
 
 from .Enum.ModelColumnTypesEnum import ModelColumnTypesEnum
+from .Utils import has_single_random
+
+_DECIMAL_TYPE = ModelColumnTypesEnum.DECIMAL.value
+
+# The rules detecting the purpose of a field by its lowercased name. They
+# are checked in order, so earlier rules win. Each rule consists of its
+# category and the exact names, suffixes and substrings matching it.
+_FIELD_RULES: Tuple[
+    Tuple[str, FrozenSet[str], Tuple[str, ...], Tuple[str, ...]], ...
+] = (
+    (
+        "email",
+        frozenset(("email", "email_address", "email_addr", "email_id")),
+        ("_email",),
+        (),
+    ),
+    ("first_name", frozenset(), (), ("first_name", "firstname")),
+    ("last_name", frozenset(), (), ("last_name", "lastname")),
+    (
+        "name",
+        frozenset(
+            (
+                "name",
+                "full_name",
+                "fullname",
+                "display_name",
+                "user_name",
+                "real_name",
+                "person_name",
+            )
+        ),
+        (),
+        (),
+    ),
+    ("address", frozenset(), (), ("address",)),
+    ("street", frozenset(), (), ("street",)),
+    ("city", frozenset(), (), ("city",)),
+    ("state", frozenset(), (), ("state",)),
+    (
+        "zip",
+        frozenset(("zip", "zipcode", "postal_code", "postcode")),
+        (),
+        (),
+    ),
+    ("country", frozenset(), (), ("country",)),
+    ("phone", frozenset(), (), ("phone", "tel")),
+    ("url", frozenset(), (), ("url", "website")),
+    ("company", frozenset(), (), ("company", "organization")),
+    ("job", frozenset(), (), ("title", "job")),
+    ("description", frozenset(), (), ("description", "bio", "about")),
+    ("username", frozenset(), (), ("username", "user_name")),
+    ("password", frozenset(), (), ("password",)),
+    ("birth", frozenset(), (), ("birth", "born")),
+    ("timestamp", frozenset(), (), ("created", "updated")),
+    ("price", frozenset(), (), ("price", "cost", "amount")),
+    ("age", frozenset(), (), ("age",)),
+    ("rating", frozenset(), (), ("score", "rating")),
+)
+
+# The Faker methods and their arguments generating the data of a category
+_CATEGORY_GENERATORS: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "email": ("email", {}),
+    "first_name": ("first_name", {}),
+    "last_name": ("last_name", {}),
+    "name": ("name", {}),
+    "address": ("address", {}),
+    "street": ("street_address", {}),
+    "city": ("city", {}),
+    "state": ("state", {}),
+    "zip": ("zipcode", {}),
+    "country": ("country", {}),
+    "phone": ("phone_number", {}),
+    "url": ("url", {}),
+    "company": ("company", {}),
+    "job": ("job", {}),
+    "description": ("text", {"max_nb_chars": 500}),
+    "username": ("user_name", {}),
+    "password": ("sha256", {}),
+    "birth": ("date_of_birth", {}),
+    "timestamp": ("date_time_this_year", {}),
+    "price": (
+        "pyfloat",
+        {"left_digits": 5, "right_digits": 2, "positive": True},
+    ),
+    "age": ("random_int", {"min": 1, "max": 100}),
+    "rating": ("random_int", {"min": 1, "max": 10}),
+    # Used instead of "price" for DECIMAL columns
+    "decimal_price": (
+        "pydecimal",
+        {"left_digits": 5, "right_digits": 2, "positive": True},
+    ),
+}
+
+
+def _build_keyword_pattern(keywords: FrozenSet[str]) -> str:
+    """
+    Builds a pattern matching a name containing any of the keywords. Only
+    keywords without another keyword inside are needed for that, and they
+    are merged into a trie, so the regex engine checks each position of a
+    name against shared prefixes instead of every keyword on its own.
+    """
+    trie: Dict[str, Dict] = {}
+    for keyword in keywords:
+        if any(other != keyword and other in keyword for other in keywords):
+            continue
+
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def to_pattern(node: Dict[str, Dict]) -> str:
+        if "" in node:
+            return ""
+
+        branches = [
+            re.escape(char) + to_pattern(child)
+            for char, child in sorted(node.items())
+        ]
+        if len(branches) == 1:
+            return branches[0]
+        return f"(?:{'|'.join(branches)})"
+
+    return to_pattern(trie)
+
+
+# Every rule needs one of its names, suffixes or substrings in the field
+# name, so names without any of them are rejected in a single search
+_ANY_KEYWORD_RE = re.compile(
+    _build_keyword_pattern(
+        frozenset(
+            keyword
+            for _, names, suffixes, keywords in _FIELD_RULES
+            for keyword in (*names, *suffixes, *keywords)
+        )
+    )
+)
+
+
+# Databases limit identifiers to about 64 characters, so of longer names
+# only both ends are checked, where prefixes and suffixes carry the
+# purpose, which bounds the work for such names
+_MAX_SCANNED_NAME_LENGTH = 64
+_SCANNED_NAME_END_LENGTH = _MAX_SCANNED_NAME_LENGTH // 2
+
+# The rules flattened into parallel tuples of keywords and the index of
+# their rule, ordered by rule, so a name is checked against each kind of
+# keyword in a single flat loop instead of a nested loop over the rules
+_RULE_CATEGORIES: Tuple[str, ...] = tuple(rule[0] for rule in _FIELD_RULES)
+_NO_RULE = len(_FIELD_RULES)
+
+# Built from the last rule to the first, so the first rule of a name wins
+_NAME_RULES: Dict[str, int] = {
+    name: index
+    for index, (_, names, _, _) in reversed(list(enumerate(_FIELD_RULES)))
+    for name in names
+}
+
+_SUFFIXES: Tuple[str, ...] = tuple(
+    suffix for _, _, suffixes, _ in _FIELD_RULES for suffix in suffixes
+)
+_SUFFIX_RULES: Tuple[int, ...] = tuple(
+    index
+    for index, (_, _, suffixes, _) in enumerate(_FIELD_RULES)
+    for _ in suffixes
+)
+_KEYWORDS: Tuple[str, ...] = tuple(
+    keyword for _, _, _, keywords in _FIELD_RULES for keyword in keywords
+)
+_KEYWORD_RULES: Tuple[int, ...] = tuple(
+    index
+    for index, (_, _, _, keywords) in enumerate(_FIELD_RULES)
+    for _ in keywords
+)
+
+
+@lru_cache(maxsize=4096)
+def _resolve_category(column_name: str) -> Optional[str]:
+    """
+    Returns the category of the first rule matching the field name, or None
+    if no rule matches. The result only depends on the name, so it is
+    cached and repeated detections of a name cost a single lookup.
+    """
+    field_name = column_name.lower()
+    if len(field_name) > _MAX_SCANNED_NAME_LENGTH:
+        # The separator keeps keywords from spanning both ends
+        field_name = (
+            f"{field_name[:_SCANNED_NAME_END_LENGTH]}|"
+            f"{field_name[-_SCANNED_NAME_END_LENGTH:]}"
+        )
+    if not _ANY_KEYWORD_RE.search(field_name):
+        return None
+
+    # An exact name is a single lookup, after which only keywords of
+    # earlier rules can still win
+    rule = _NAME_RULES.get(field_name, _NO_RULE)
+    for suffix, index in zip(_SUFFIXES, _SUFFIX_RULES):
+        if index >= rule:
+            break
+        if field_name.endswith(suffix):
+            rule = index
+            break
+    for keyword, index in zip(_KEYWORDS, _KEYWORD_RULES):
+        if index >= rule:
+            break
+        if keyword in field_name:
+            rule = index
+            break
+
+    return _RULE_CATEGORIES[rule] if rule < _NO_RULE else None
+
+
+def _random_hex_digest(faker: Faker) -> str:
+    """
+    Returns 64 random hex digits shaped like a SHA256 hex digest, as the
+    value only needs to look like a password hash and hashing a random
+    value first gains nothing. The random instance is looked up on every
+    call, as seeding a Faker instance for the first time replaces it.
+    """
+    return f"{faker.random.getrandbits(256):064x}"
 
 
 class SmartFieldDetector:
@@ -12,99 +234,91 @@ class SmartFieldDetector:
     """
 
     def __init__(self, faker: Faker):
-        self.faker = faker
+        self._faker = faker
+        self._generators: Dict[str, Callable[[], Any]] = {}
+
+    @property
+    def faker(self) -> Faker:
+        """
+        The Faker instance generating the data.
+        """
+        return self._faker
+
+    @faker.setter
+    def faker(self, faker: Faker) -> None:
+        # The cached generators are bound to the previous instance
+        self._faker = faker
+        self._generators = {}
 
     def detect_and_generate(self, column: Column) -> Optional[Any]:
         """
         Detects field purpose based on name and generates appropriate data.
         Returns None if no smart detection is possible.
         """
-        field_name = column.name.lower()
-        column_type = column.type
-
-        if (
-            field_name == "email"
-            or field_name.endswith("_email")
-            or field_name == "email_address"
-            or (
-                field_name.startswith("email_")
-                and field_name in ["email_addr", "email_id"]
-            )
-        ):
-            return self.faker.email()
-
-        if "first_name" in field_name or "firstname" in field_name:
-            return self.faker.first_name()
-        if "last_name" in field_name or "lastname" in field_name:
-            return self.faker.last_name()
-        if field_name in ["name", "full_name", "fullname"] or field_name in [
-            "display_name",
-            "user_name",
-            "real_name",
-            "person_name",
-        ]:
-            return self.faker.name()
-
-        if "address" in field_name:
-            return self.faker.address()
-        if "street" in field_name:
-            return self.faker.street_address()
-        if "city" in field_name:
-            return self.faker.city()
-        if "state" in field_name:
-            return self.faker.state()
-        if field_name in ["zip", "zipcode", "postal_code", "postcode"]:
-            return self.faker.zipcode()
-        if "country" in field_name:
-            return self.faker.country()
-
-        if "phone" in field_name or "tel" in field_name:
-            return self.faker.phone_number()
-
-        if "url" in field_name or "website" in field_name:
-            return self.faker.url()
-
-        if "company" in field_name or "organization" in field_name:
-            return self.faker.company()
-
-        if "title" in field_name or "job" in field_name:
-            return self.faker.job()
-
-        if (
-            "description" in field_name
-            or "bio" in field_name
-            or "about" in field_name
-        ):
-            return self.faker.text(max_nb_chars=500)
-
-        if "username" in field_name or "user_name" in field_name:
-            return self.faker.user_name()
-
-        if "password" in field_name:
-            return self.faker.sha256()
-
-        if "birth" in field_name or "born" in field_name:
-            return self.faker.date_of_birth()
-        if "created" in field_name or "updated" in field_name:
-            return self.faker.date_time_this_year()
-
-        if (
-            "price" in field_name
-            or "cost" in field_name
-            or "amount" in field_name
-        ):
-            if isinstance(column_type, ModelColumnTypesEnum.DECIMAL.value):
-                return self.faker.pydecimal(
-                    left_digits=5, right_digits=2, positive=True
-                )
-            return self.faker.pyfloat(
-                left_digits=5, right_digits=2, positive=True
-            )
+        generator = self.get_generator(column)
+        if generator is None:
+            return None
+        return generator()
 
-        if "age" in field_name:
-            return self.faker.random_int(min=1, max=100)
+    def detect_and_generate_many(
+        self, column: Column, amount: int
+    ) -> List[Optional[Any]]:
+        """
+        Detects field purpose based on name once and generates the given
+        amount of appropriate data. Returns a list of None if no smart
+        detection is possible.
 
-        if "score" in field_name or "rating" in field_name:
-            return self.faker.random_int(min=1, max=10)
+        :param column: The column to generate the data for
+        :param amount: The amount of values to generate
+        """
+        generator = self.get_generator(column)
+        if generator is None:
+            return [None] * amount
+        return [generator() for _ in range(amount)]
 
-        return None
+    def get_generator(self, column: Column) -> Optional[Callable[[], Any]]:
+        """
+        Detects field purpose based on name and returns the generator of
+        appropriate data, so the name only needs to be checked once per
+        column. The generator of a category is resolved on its first use
+        and reused afterwards. Returns None if no smart detection is
+        possible.
+        """
+        category = _resolve_category(column.name)
+        if category is None:
+            return None
+
+        if category == "price" and isinstance(column.type, _DECIMAL_TYPE):
+            category = "decimal_price"
+
+        generator = self._generators.get(category)
+        if generator is None:
+            generator = self.__build_generator(category)
+            self._generators[category] = generator
+        return generator
+
+    def __build_generator(self, category: str) -> Callable[[], Any]:
+        """
+        Returns the generator of the given category.
+
+        :param category: The category to build the generator for
+        """
+        faker = self.faker
+        if category == "password" and has_single_random(faker):
+            return partial(_random_hex_digest, faker)
+
+        name, kwargs = _CATEGORY_GENERATORS[category]
+        return self.__get_method(name, **kwargs)
+
+    def __get_method(self, name: str, **kwargs: Any) -> Callable[[], Any]:
+        """
+        Returns the Faker method of the given name with its arguments bound.
+        With multiple locales, the method is looked up on every call, so
+        Faker keeps picking the locale per value.
+        """
+        faker = self.faker
+        if not has_single_random(faker):
+            return lambda: getattr(faker, name)(**kwargs)
+
+        method = getattr(faker, name)
+        return partial(method, **kwargs) if kwargs else method
@@ -0,0 +1,10 @@
+from faker import Faker
+
+
+def has_single_random(faker: Faker) -> bool:
+    """
+    Returns whether the random instance of the Faker can be used directly,
+    as Faker only exposes it for a single locale. Faker versions before
+    multi-locale support have no locales and always a single instance.
+    """
+    return len(getattr(faker, "locales", ())) <= 1
@@ -0,0 +1,3 @@
+from .FakerUtils import has_single_random
+
+__all__ = ["has_single_random"]
@@ -1,7 +1,9 @@
 import json
-from datetime import date, datetime
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
 
 import pytest
+from faker import Faker
 from sqlalchemy import (
     Boolean,
     Column,
@@ -16,10 +18,14 @@ from sqlalchemy import (
     Time,
     LargeBinary,
     create_engine,
+    event,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.types import DECIMAL
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from enum import Enum as PyEnum
 from sqlalchemy_fake_model import ModelFaker
@@ -32,6 +38,12 @@ Test the ModelFaker class
 
 Base = declarative_base()
 
+# Faker only supports multiple locales from version 3.0 on
+requires_multi_locale_faker = pytest.mark.skipif(
+    not hasattr(Faker(), "locales"),
+    reason="Faker version without multi-locale support",
+)
+
 class StatusTypesEnum(PyEnum):
 
     CREATED = "created"
@@ -81,33 +93,114 @@ class MyModel(Base):
     )
 
 
-@pytest.fixture(scope="function")
+def create_test_engine():
+    """
+    Creates an in-memory SQLite engine whose single connection is shared
+    by all of its sessions. Durability is not needed for tests, so SQLite
+    neither syncs nor writes its journal to disk.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    return engine
+
+
+@pytest.fixture(scope="session")
 def engine():
-    return create_engine("sqlite:///:memory:")
+    """
+    Fixture to create a single in-memory database for the whole test run.
+    """
+    engine = create_test_engine()
+
+    # pysqlite does not emit BEGIN itself, which breaks SAVEPOINTs
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(connection):
+        connection.execute(text("BEGIN"))
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@contextmanager
+def rolled_back_session(engine):
+    """
+    Opens a session inside a transaction, which is rolled back on exit.
+    Commits of the session only release a SAVEPOINT, which gets restarted
+    right away.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection)
+    session.begin_nested()
+
+    @event.listens_for(session, "after_transaction_end")
+    def restart_savepoint(session, transaction):
+        if transaction.nested and not transaction._parent.nested:
+            session.begin_nested()
+
+    try:
+        yield session
+    finally:
+        session.close()
+        if transaction.is_active:
+            transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
 def session(engine):
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    yield session
-    session.close()
-    Base.metadata.drop_all(engine)
+    """
+    Fixture to create a session inside a transaction, which is rolled back
+    after the test, so every test starts with an empty database.
+    """
+    with rolled_back_session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def isolated_base():
+    """
+    Fixture to create a declarative base for the models of a single test,
+    so they do not pile up in the metadata of the shared Base.
+    """
+    return declarative_base()
 
 
 @pytest.fixture
 def fake_data(session) -> ModelFaker:
     """
-    Fixture to create fake data for the MyModel model.
+    Fixture to create fake data for the MyModel model. The session is
+    rolled back after each test anyway, so it is only flushed.
     """
-    model_faker = ModelFaker(MyModel, session)
+    model_faker = ModelFaker(
+        MyModel, session, config=ModelFakerConfig(commit=False)
+    )
 
     return model_faker
 
 
-def test_flask_integration() -> None:
-    """Test the Flask integration."""
+@pytest.fixture(scope="session")
+def flask_db():
+    """
+    Fixture to create a Flask app with a Flask-SQLAlchemy database and
+    the model used by the Flask integration test.
+    """
     from flask import Flask
     from flask_sqlalchemy import SQLAlchemy
 
@@ -146,34 +239,34 @@ def test_flask_integration() -> None:
 
     with app.app_context():
         db.create_all()
-        model_faker = ModelFaker(MyFlaskModel)
-        model_faker.create(amount=5)
-        fake_entries = db.session.query(MyFlaskModel).all()
-        assert len(fake_entries) == 5
 
+    return app, db, MyFlaskModel
 
-def test_tornado_integration() -> None:
-    """Test the tornado integration."""
+
+@pytest.fixture(scope="session")
+def tornado_app():
+    """
+    Fixture to create a tornado app with a session in its settings.
+    """
     from tornado.web import Application
 
     app = Application()
-    app.settings["db"] = sessionmaker(
-        bind=create_engine("sqlite:///:memory:")
-    )()
+    app.settings["db"] = sessionmaker(bind=create_test_engine())()
 
     Base.metadata.create_all(app.settings["db"].bind)
-    model_faker = ModelFaker(MyModel, app.settings["db"])
-    model_faker.create(amount=5)
-    fake_entries = app.settings["db"].query(MyModel).all()
-    assert len(fake_entries) == 5
+    yield app
+    app.settings["db"].close()
+    app.settings["db"].bind.dispose()
 
 
-def test_django_integration() -> None:
-    """Test the Django integration."""
+@pytest.fixture(scope="session")
+def django_session():
+    """
+    Fixture to configure Django, which can only be done once per process,
+    and to create a session next to it.
+    """
     import django
     from django.conf import settings
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
 
     settings.configure(
         DATABASES={
@@ -185,15 +278,36 @@ def test_django_integration() -> None:
     )
     django.setup()
 
-    engine = create_engine("sqlite:///:memory:")
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    session = sessionmaker(bind=create_test_engine())()
 
-    Base.metadata.create_all(engine)
-    model_faker = ModelFaker(MyModel, session)
+    Base.metadata.create_all(session.bind)
+    yield session
+    session.close()
+    session.bind.dispose()
+
+
+def test_flask_integration(flask_db) -> None:
+    """Test the Flask integration."""
+    app, db, MyFlaskModel = flask_db
+
+    with app.app_context():
+        model_faker = ModelFaker(MyFlaskModel)
+        model_faker.create(amount=5)
+        assert db.session.query(MyFlaskModel).count() == 5
+
+
+def test_tornado_integration(tornado_app) -> None:
+    """Test the tornado integration."""
+    model_faker = ModelFaker(MyModel, tornado_app.settings["db"])
     model_faker.create(amount=5)
-    fake_entries = session.query(MyModel).all()
-    assert len(fake_entries) == 5
+    assert tornado_app.settings["db"].query(MyModel).count() == 5
+
+
+def test_django_integration(django_session) -> None:
+    """Test the Django integration."""
+    model_faker = ModelFaker(MyModel, django_session)
+    model_faker.create(amount=5)
+    assert django_session.query(MyModel).count() == 5
 
 
 def test_create_fake_data(fake_data, session) -> None:
@@ -206,22 +320,95 @@ def test_create_fake_data(fake_data, session) -> None:
     assert len(fake_entries) == 5
 
 
-def test_create_fake_data_invalid_amount(fake_data, session) -> None:
+@pytest.mark.parametrize("amount", [-1, "5", 5.5, None, "invalid"])
+def test_create_fake_data_invalid_amount(fake_data, amount) -> None:
     """
-    Test if the ModelFaker is able to create fake data and validate each field.
+    Test if invalid amounts are rejected before any data is created.
     """
     with pytest.raises(InvalidAmountError):
-        fake_data.create(amount="invalid")
+        fake_data.create(amount=amount)
 
 
-def test_nullable_field(fake_data, session) -> None:
+@pytest.fixture(scope="module")
+def one_entry(engine) -> MyModel:
     """
-    Test if the nullable fields are handled correctly by ModelFaker.
+    Fixture to create a single MyModel entry with the default configuration,
+    which is shared by the field tests of this module.
     """
-    fake_data.create()
+    with rolled_back_session(engine) as session:
+        ModelFaker(MyModel, session).create()
+
+        entry = session.query(MyModel).first()
+        session.expunge(entry)
+
+    return entry
+
+
+def is_float_with_precision(value) -> bool:
+    """
+    Checks if the value is a float which fits a precision of (5, 2).
+    """
+    digits = str(value).replace("-", "")
+    integer, _, fraction = digits.partition(".")
+    return (
+        isinstance(value, float)
+        and len(integer + fraction) <= 5
+        and len(fraction) <= 2
+    )
+
+
+def is_json_list(value) -> bool:
+    """
+    Checks if the value is the JSON of the list schema of MyModel.
+    """
+    json_data = json.loads(value)
+    return (
+        isinstance(json_data, list)
+        and len(json_data) == 5
+        and isinstance(json_data[0], str)
+        and isinstance(json_data[1], int)
+    )
 
-    entry = session.query(MyModel).first()
-    assert entry.nullable_field is None
+
+def is_json_obj(value) -> bool:
+    """
+    Checks if the value is the JSON of the object schema of MyModel.
+    """
+    json_data = json.loads(value)
+    return (
+        isinstance(json_data, dict)
+        and isinstance(json_data["street"], str)
+        and isinstance(json_data["location"], dict)
+        and isinstance(json_data["location"]["city"], str)
+        and isinstance(json_data["location"]["zip"], int)
+    )
+
+
+@pytest.mark.parametrize(
+    "attr,check",
+    [
+        ("nullable_field", lambda value: value is None),
+        ("default_field", lambda value: value == "test123"),
+        ("enum_field", lambda value: value == StatusTypesEnum.CREATED),
+        ("string_field", lambda value: isinstance(value, str)),
+        ("integer_field", lambda value: isinstance(value, int)),
+        (
+            "max_min_integer_field",
+            lambda value: isinstance(value, int) and 100 <= value <= 101,
+        ),
+        ("float_field", is_float_with_precision),
+        ("boolean_field", lambda value: isinstance(value, bool)),
+        ("date_field", lambda value: isinstance(value, date)),
+        ("datetime_field", lambda value: isinstance(value, datetime)),
+        ("json_list_field", is_json_list),
+        ("json_obj_field", is_json_obj),
+    ],
+)
+def test_field(one_entry, attr, check) -> None:
+    """
+    Test if each field of a created entry is handled correctly.
+    """
+    assert check(getattr(one_entry, attr))
 
 
 def test_nullable_field_fill(fake_data, session) -> None:
@@ -236,24 +423,26 @@ def test_nullable_field_fill(fake_data, session) -> None:
     assert entry.nullable_field is not None
 
 
-def test_default_value(fake_data, session) -> None:
+def test_skipped_fields_not_generated(session) -> None:
     """
-    Test if the default value is correctly set (for price).
+    Test if nullable and default fields are left out of the rows without
+    generating a value for them.
     """
-    fake_data.create()
+    calls = []
 
-    entry = session.query(MyModel).first()
-    assert entry.default_field == "test123"
+    def generate() -> str:
+        calls.append(None)
+        return "generated"
 
+    config = ModelFakerConfig(
+        field_overrides={"nullable_field": generate, "default_field": generate}
+    )
+    ModelFaker(MyModel, session, config=config).create(amount=5)
 
-def test_enum_default_value(fake_data, session) -> None:
-    """
-    Test if the default value is correctly set (for price).
-    """
-    fake_data.create()
-
-    entry = session.query(MyModel).first()
-    assert entry.enum_field == StatusTypesEnum.CREATED
+    assert calls == []
+    for entry in session.query(MyModel).all():
+        assert entry.nullable_field is None
+        assert entry.default_field == "test123"
 
 
 def test_default_value_fill(fake_data, session) -> None:
@@ -268,123 +457,130 @@ def test_default_value_fill(fake_data, session) -> None:
     assert entry.default_field != "test123"
 
 
-def test_string_field(fake_data, session) -> None:
+def test_max_min_integer_field_batch(session) -> None:
     """
-    Test if the string field is handled correctly.
+    Test if the integer range is respected when generated as a batch.
     """
-    fake_data.create()
+    ModelFaker(
+        MyModel, session, config=ModelFakerConfig(smart_detection=False)
+    ).create(amount=50)
 
-    entry = session.query(MyModel).first()
-    assert isinstance(entry.string_field, str)
+    entries = session.query(MyModel).all()
+    assert len(entries) == 50
 
+    # Dates are drawn up to the start of the current day in UTC
+    utc_now = datetime.now(timezone.utc).replace(tzinfo=None)
 
-def test_integer_field(fake_data, session) -> None:
-    """
-    Test if the integer field is handled correctly.
-    """
-    fake_data.create()
-
-    entry = session.query(MyModel).first()
-    assert isinstance(entry.integer_field, int)
+    for entry in entries:
+        assert 100 <= entry.max_min_integer_field <= 101
+        assert isinstance(entry.boolean_field, bool)
+        assert is_float_with_precision(entry.float_field)
+        assert isinstance(entry.date_field, date)
+        assert date(1970, 1, 1) <= entry.date_field <= utc_now.date()
+        assert isinstance(entry.datetime_field, datetime)
+        assert datetime(1970, 1, 1) <= entry.datetime_field <= utc_now
 
 
-def test_max_min_integer_field(fake_data, session) -> None:
+def test_float_field_integer_precision(session, isolated_base) -> None:
     """
-    Test if the integer field is handled correctly.
+    Test if a float column with a plain integer precision is handled.
     """
-    fake_data.create()
-
-    entry = session.query(MyModel).first()
-    assert isinstance(entry.max_min_integer_field, int)
-    assert entry.max_min_integer_field >= 100
-    assert entry.max_min_integer_field <= 101
 
+    class FloatModel(isolated_base):
+        __tablename__ = "float_model"
 
-def test_float_field(fake_data, session) -> None:
-    """
-    Test if the integer field is handled correctly.
-    """
-    fake_data.create()
+        id = Column(Integer, primary_key=True)
+        float_field = Column(Float(precision=10), nullable=False)
 
-    entry = session.query(MyModel).first()
-    assert isinstance(entry.float_field, float)
+    isolated_base.metadata.create_all(session.bind)
 
-    precision = len(str(entry.float_field).replace(".", "").replace("-", ""))
-    assert precision <= 5
+    ModelFaker(FloatModel, session).create(amount=3)
 
-    scale = (
-        len(str(entry.float_field).split(".")[1])
-        if "." in str(entry.float_field)
-        else 0
-    )
-    assert scale <= 2
+    for entry in session.query(FloatModel).all():
+        assert isinstance(entry.float_field, float)
 
 
-def test_bool_field(fake_data, session) -> None:
+def test_json_doc_parsed_once(session, monkeypatch, isolated_base) -> None:
     """
-    Test if the bool field is handled correctly.
+    Test if the JSON schema of a docstring is only parsed once, and not
+    for every created row.
     """
-    fake_data.create()
 
-    entry = session.query(MyModel).first()
-    assert isinstance(entry.boolean_field, bool)
+    class JsonDocModel(isolated_base):
+        __tablename__ = "json_doc_model"
 
+        id = Column(Integer, primary_key=True)
+        json_field = Column(
+            Text, nullable=False, doc='{"tags": ["string", "string"]}'
+        )
 
-def test_date_field(fake_data, session) -> None:
-    """
-    Test if the date field is handled correctly.
-    """
-    fake_data.create()
+    isolated_base.metadata.create_all(session.bind)
 
-    entry = session.query(MyModel).first()
-    assert isinstance(entry.date_field, date)
+    parsed = []
+    loads = json.loads
 
+    def counting_loads(value, *args, **kwargs):
+        parsed.append(value)
+        return loads(value, *args, **kwargs)
 
-def test_datetime_field(fake_data, session) -> None:
-    """
-    Test if the datetime field is handled correctly.
-    """
-    fake_data.create()
+    monkeypatch.setattr(json, "loads", counting_loads)
 
-    entry = session.query(MyModel).first()
-    assert isinstance(entry.datetime_field, datetime)
+    ModelFaker(JsonDocModel, session).create(amount=10)
+    ModelFaker(JsonDocModel, session).create(amount=10)
 
+    monkeypatch.undo()
 
-def test_json_list_field(fake_data, session) -> None:
+    assert parsed == ['{"tags": ["string", "string"]}']
+    assert session.query(JsonDocModel).count() == 20
+
+
+def test_json_doc_field_with_smart_name(session, isolated_base) -> None:
     """
-    Test if the json field is handled correctly.
+    Test if a JSON docstring wins over smart detection of the field name.
     """
-    fake_data.create()
 
-    entry = session.query(MyModel).first()
+    class JsonAddressModel(isolated_base):
+        __tablename__ = "json_address_model"
+
+        id = Column(Integer, primary_key=True)
+        address = Column(
+            Text,
+            nullable=False,
+            doc='{"street": "string", "zip": "integer"}',
+        )
 
-    assert entry.json_list_field is not None
-    assert isinstance(entry.json_list_field, str)
+    isolated_base.metadata.create_all(session.bind)
 
-    json_data = json.loads(entry.json_list_field)
-    assert isinstance(json_data, list)
-    assert len(json_data) == 5
+    ModelFaker(JsonAddressModel, session).create(amount=3)
 
-    assert isinstance(json_data[0], str)
-    assert isinstance(json_data[1], int)
+    for entry in session.query(JsonAddressModel).all():
+        json_data = json.loads(entry.address)
+        assert isinstance(json_data["street"], str)
+        assert isinstance(json_data["zip"], int)
 
 
-def test_json_obj_field(fake_data, session) -> None:
+def test_json_type_field(session, isolated_base) -> None:
     """
-    Test if the json field is handled correctly.
+    Test if a JSON typed field without docstring gets the default structure.
     """
-    fake_data.create()
 
-    entry = session.query(MyModel).first()
-    assert isinstance(entry.json_obj_field, str)
+    class JsonModel(isolated_base):
+        __tablename__ = "json_model"
 
-    json_data = json.loads(entry.json_obj_field)
-    assert isinstance(json_data, dict)
+        id = Column(Integer, primary_key=True)
+        json_field = Column(JSON, nullable=False)
+
+    isolated_base.metadata.create_all(session.bind)
 
-    assert isinstance(json_data["street"], str)
-    assert isinstance(json_data["location"], dict)
-    assert isinstance(json_data["location"]["city"], str)
-    assert isinstance(json_data["location"]["zip"], int)
+    ModelFaker(JsonModel, session).create(amount=2)
+
+    entries = session.query(JsonModel).all()
+    assert len(entries) == 2
+
+    for entry in entries:
+        assert isinstance(entry.json_field["id"], int)
+        assert isinstance(entry.json_field["name"], str)
+        assert isinstance(entry.json_field["active"], bool)
 
 
 def test_foreign_key(fake_data, session) -> None:
@@ -399,7 +595,9 @@ def test_foreign_key(fake_data, session) -> None:
         id = Column(Integer, primary_key=True)
         foreign_key = Column(Integer, ForeignKey("mymodel.id"), nullable=False)
 
-    Base.metadata.create_all(session.bind)
+    Base.metadata.create_all(
+        session.bind, tables=[MyModelForeignKey.__table__]
+    )
 
     fake_foreign_entries = session.query(MyModel).all()
     assert len(fake_foreign_entries) == 0
@@ -413,18 +611,18 @@ def test_foreign_key(fake_data, session) -> None:
     assert len(fake_foreign_entries) == 1
 
 
-def test_foreign_key_not_id(fake_data, session) -> None:
+def test_foreign_key_not_id(fake_data, session, isolated_base) -> None:
     """
     Test if the foreign key field is handled correctly.
     """
 
-    class MyModel2(Base):
+    class MyModel2(isolated_base):
 
         __tablename__ = "mymodel2"
 
         name = Column(String, primary_key=True)
 
-    class MyModel3(Base):
+    class MyModel3(isolated_base):
 
         __tablename__ = "mymodel3"
 
@@ -433,7 +631,7 @@ def test_foreign_key_not_id(fake_data, session) -> None:
             String, ForeignKey("mymodel2.name"), nullable=False
         )
 
-    Base.metadata.create_all(session.bind)
+    isolated_base.metadata.create_all(session.bind)
 
     fake_foreign_entries = session.query(MyModel2).all()
     assert len(fake_foreign_entries) == 0
@@ -447,10 +645,88 @@ def test_foreign_key_not_id(fake_data, session) -> None:
     assert len(fake_foreign_entries) == 1
 
 
-def test_new_data_types(session) -> None:
+def test_foreign_key_reuses_related_record(fake_data, session) -> None:
+    """
+    Test if multiple rows share the related record of a foreign key.
+    """
+
+    class MyModelForeignKeyMany(Base):
+
+        __tablename__ = "mymodel_foreignkey_many"
+
+        id = Column(Integer, primary_key=True)
+        foreign_key = Column(Integer, ForeignKey("mymodel.id"), nullable=False)
+
+    Base.metadata.create_all(
+        session.bind, tables=[MyModelForeignKeyMany.__table__]
+    )
+
+    ModelFaker(MyModelForeignKeyMany, session).create(amount=5)
+
+    fake_entries = session.query(MyModelForeignKeyMany).all()
+    assert len(fake_entries) == 5
+    assert len({entry.foreign_key for entry in fake_entries}) == 1
+
+    fake_foreign_entries = session.query(MyModel).all()
+    assert len(fake_foreign_entries) == 1
+
+
+def test_foreign_key_picks_existing_records(fake_data, session) -> None:
+    """
+    Test if foreign keys are picked from the existing related records.
+    """
+
+    class MyModelForeignKeyPool(Base):
+
+        __tablename__ = "mymodel_foreignkey_pool"
+
+        id = Column(Integer, primary_key=True)
+        foreign_key = Column(Integer, ForeignKey("mymodel.id"), nullable=False)
+
+    Base.metadata.create_all(
+        session.bind, tables=[MyModelForeignKeyPool.__table__]
+    )
+
+    ModelFaker(MyModel, session).create(amount=3)
+    ModelFaker(MyModelForeignKeyPool, session).create(amount=20)
+
+    parent_ids = {entry.id for entry in session.query(MyModel).all()}
+    assert len(parent_ids) == 3
+
+    fake_entries = session.query(MyModelForeignKeyPool).all()
+    assert len(fake_entries) == 20
+    assert {entry.foreign_key for entry in fake_entries} <= parent_ids
+
+
+def test_foreign_key_seed_reproducibility(session) -> None:
+    """Test that seeded runs pick the same foreign keys."""
+
+    class MyModelForeignKeySeed(Base):
+
+        __tablename__ = "mymodel_foreignkey_seed"
+
+        id = Column(Integer, primary_key=True)
+        foreign_key = Column(Integer, ForeignKey("mymodel.id"), nullable=False)
+
+    ModelFaker(MyModel, session).create(amount=5)
+
+    def pick_foreign_keys():
+        model_faker = ModelFaker(
+            MyModelForeignKeySeed, session, config=ModelFakerConfig(seed=1)
+        )
+        return [model_faker._make_row()["foreign_key"] for _ in range(10)]
+
+    first_values = pick_foreign_keys()
+    second_values = pick_foreign_keys()
+
+    assert first_values == second_values
+    assert len(set(first_values)) > 1
+
+
+def test_new_data_types(session, isolated_base) -> None:
     """Test the new data types functionality."""
 
-    class ExtendedModel(Base):
+    class ExtendedModel(isolated_base):
         __tablename__ = "extended_model"
 
         id = Column(Integer, primary_key=True)
@@ -461,7 +737,7 @@ def test_new_data_types(session) -> None:
         binary_field = Column(LargeBinary, nullable=False)
         json_field = Column(Text, nullable=False)  # JSON as text for SQLite
 
-    Base.metadata.create_all(session.bind)
+    isolated_base.metadata.create_all(session.bind)
 
     ModelFaker(ExtendedModel, session).create(amount=3)
 
@@ -477,10 +753,10 @@ def test_new_data_types(session) -> None:
         assert entry.json_field is not None
 
 
-def test_smart_field_detection_integration(session) -> None:
+def test_smart_field_detection_integration(session, isolated_base) -> None:
     """Test smart field detection integration with ModelFaker."""
 
-    class SmartModel(Base):
+    class SmartModel(isolated_base):
         __tablename__ = "smart_model"
 
         id = Column(Integer, primary_key=True)
@@ -492,7 +768,7 @@ def test_smart_field_detection_integration(session) -> None:
         age = Column(Integer, nullable=False)
         price = Column(Float, nullable=False)
 
-    Base.metadata.create_all(session.bind)
+    isolated_base.metadata.create_all(session.bind)
 
     config = ModelFakerConfig(smart_detection=True)
     ModelFaker(SmartModel, session, config=config).create(amount=2)
@@ -506,17 +782,17 @@ def test_smart_field_detection_integration(session) -> None:
         assert entry.price >= 0
 
 
-def test_smart_detection_disabled(session) -> None:
+def test_smart_detection_disabled(session, isolated_base) -> None:
     """Test that smart detection can be disabled."""
 
-    class BasicModel(Base):
+    class BasicModel(isolated_base):
         __tablename__ = "basic_model"
 
         id = Column(Integer, primary_key=True)
         email = Column(String(255), nullable=False)
         age = Column(Integer, nullable=False)
 
-    Base.metadata.create_all(session.bind)
+    isolated_base.metadata.create_all(session.bind)
 
     config = ModelFakerConfig(smart_detection=False)
     faker = ModelFaker(BasicModel, session, config=config)
@@ -534,17 +810,17 @@ def test_smart_detection_disabled(session) -> None:
     assert isinstance(entry.age, int)
 
 
-def test_field_overrides(session) -> None:
+def test_field_overrides(session, isolated_base) -> None:
     """Test custom field overrides."""
 
-    class OverrideModel(Base):
+    class OverrideModel(isolated_base):
         __tablename__ = "override_model"
 
         id = Column(Integer, primary_key=True)
         name = Column(String(100), nullable=False)
         status = Column(String(50), nullable=False)
 
-    Base.metadata.create_all(session.bind)
+    isolated_base.metadata.create_all(session.bind)
 
     def custom_status():
         return "ACTIVE"
@@ -564,6 +840,21 @@ def test_field_overrides(session) -> None:
         assert entry.status == "ACTIVE"
 
 
+def test_config_changes_after_first_use(session) -> None:
+    """Test that config changes apply to rows generated afterwards."""
+    model_faker = ModelFaker(MyModel, None)
+    assert "nullable_field" not in model_faker._make_row()
+
+    model_faker.config.fill_nullable_fields = True
+    model_faker.config.field_overrides["string_field"] = lambda: "override"
+    row = model_faker._make_row()
+    assert "nullable_field" in row
+    assert row["string_field"] == "override"
+
+    model_faker.config.field_overrides.clear()
+    assert model_faker._make_row()["string_field"] != "override"
+
+
 def test_create_batch_without_commit(session) -> None:
     """Test create_batch without committing."""
 
@@ -644,40 +935,66 @@ def test_context_manager(session) -> None:
     assert len(entries) == 2
 
 
-def test_seed_reproducibility(session) -> None:
+def test_seed_reproducibility() -> None:
     """Test that seed produces reproducible results."""
+    first_row = ModelFaker(
+        MyModel, None, config=ModelFakerConfig(seed=12345)
+    )._make_row()
+    second_row = ModelFaker(
+        MyModel, None, config=ModelFakerConfig(seed=12345)
+    )._make_row()
+
+    assert first_row == second_row
+    assert {"string_field", "integer_field", "boolean_field"} <= set(
+        first_row
+    )
 
-    config1 = ModelFakerConfig(seed=12345)
-    config2 = ModelFakerConfig(seed=12345)
 
-    faker1 = ModelFaker(MyModel, session, config=config1)
-    faker2 = ModelFaker(MyModel, session, config=config2)
+def test_seed_reproducibility_enum_batch() -> None:
+    """Test that seeded batches of enum values are reproducible."""
+    column = MyModel.__table__.c.enum_field
+    first_values, second_values = (
+        ModelFaker(
+            MyModel, None, config=ModelFakerConfig(seed=12345)
+        )._build_fake_data_batch_generator(column)(20)
+        for _ in range(2)
+    )
 
-    # Clear any existing data
-    session.query(MyModel).delete()
-    session.commit()
+    assert first_values == second_values
 
-    faker1.create(amount=1)
-    first_entry = session.query(MyModel).first()
-    first_values = {
-        'string_field': first_entry.string_field,
-        'integer_field': first_entry.integer_field,
-        'boolean_field': first_entry.boolean_field
-    }
 
-    # Clear and create with second faker
-    session.query(MyModel).delete()
-    session.commit()
+def test_default_faker_is_shared(session) -> None:
+    """Test that unseeded instances share one Faker per locale."""
 
-    faker2.create(amount=1)
-    second_entry = session.query(MyModel).first()
-    second_values = {
-        'string_field': second_entry.string_field,
-        'integer_field': second_entry.integer_field,
-        'boolean_field': second_entry.boolean_field
-    }
+    faker1 = ModelFaker(MyModel, session)
+    faker2 = ModelFaker(MyModel, session)
+    seeded_faker = ModelFaker(
+        MyModel, session, config=ModelFakerConfig(seed=12345)
+    )
 
-    assert first_values == second_values
+    assert faker1.faker is faker2.faker
+    assert seeded_faker.faker is not faker1.faker
+
+
+def test_public_attributes_writable(session) -> None:
+    """Test that the session, Faker and smart detector can be replaced."""
+    from faker import Faker
+
+    model_faker = ModelFaker(MyModel, None)
+    model_faker.db = session
+    assert model_faker.db is session
+
+    model_faker._make_row()
+    first_detector = model_faker.smart_detector
+    faker = Faker("de_DE")
+    model_faker.faker = faker
+    assert model_faker.faker is faker
+    assert model_faker.smart_detector is not first_detector
+    assert model_faker.smart_detector.faker is faker
+
+    model_faker.smart_detector = None
+    assert model_faker.smart_detector is None
+    model_faker._make_row()
 
 
 def test_bulk_creation(session) -> None:
@@ -692,6 +1009,49 @@ def test_bulk_creation(session) -> None:
     assert len(entries) == 250
 
 
+def test_create_without_commit(session) -> None:
+    """Test creation which only flushes the session."""
+    config = ModelFakerConfig(commit=False)
+    ModelFaker(MyModel, session, config=config).create(amount=3)
+
+    assert not session.new
+    assert session.query(MyModel).count() == 3
+
+    session.rollback()
+    assert session.query(MyModel).count() == 0
+
+
+def test_create_with_bulk_insert(session) -> None:
+    """Test creation with a single executemany statement per batch."""
+    config = ModelFakerConfig(bulk_insert=True)
+    ModelFaker(MyModel, session, config=config).create(amount=5)
+
+    entries = session.query(MyModel).all()
+    assert len(entries) == 5
+    assert all(entry.default_field == "test123" for entry in entries)
+
+
+def test_create_runs_orm_validators(session, isolated_base) -> None:
+    """Test that creation goes through the ORM session by default."""
+    from sqlalchemy.orm import validates
+
+    class ValidatedModel(isolated_base):
+        __tablename__ = "validated_model"
+        id = Column(Integer, primary_key=True)
+        title = Column(String(50), nullable=False)
+
+        @validates("title")
+        def validate_title(self, key, value):
+            return "validated"
+
+    isolated_base.metadata.create_all(session.bind)
+
+    ModelFaker(ValidatedModel, session).create(amount=3)
+
+    titles = {entry.title for entry in session.query(ValidatedModel)}
+    assert titles == {"validated"}
+
+
 def test_edge_case_zero_amount(session) -> None:
     """Test creating zero records."""
     faker = ModelFaker(MyModel, session)
@@ -723,38 +1083,6 @@ def test_edge_case_bulk_size_one(session) -> None:
     assert len(entries) == 3
 
 
-def test_edge_case_negative_amount(session) -> None:
-    """Test that negative amounts raise error."""
-    faker = ModelFaker(MyModel, session)
-
-    with pytest.raises(InvalidAmountError):
-        faker.create(amount=-1)
-
-
-def test_edge_case_string_amount(session) -> None:
-    """Test that string amounts raise error."""
-    faker = ModelFaker(MyModel, session)
-
-    with pytest.raises(InvalidAmountError):
-        faker.create(amount="5")
-
-
-def test_edge_case_float_amount(session) -> None:
-    """Test that float amounts raise error."""
-    faker = ModelFaker(MyModel, session)
-
-    with pytest.raises(InvalidAmountError):
-        faker.create(amount=5.5)
-
-
-def test_edge_case_none_amount(session) -> None:
-    """Test that None amount raises error."""
-    faker = ModelFaker(MyModel, session)
-
-    with pytest.raises(InvalidAmountError):
-        faker.create(amount=None)
-
-
 def test_edge_case_empty_overrides(session) -> None:
     """Test create_with with empty overrides."""
     faker = ModelFaker(MyModel, session)
@@ -781,7 +1109,7 @@ def test_edge_case_none_overrides(session) -> None:
     assert entry.string_field == "test"
 
 
-def test_edge_case_invalid_field_override(session) -> None:
+def test_edge_case_invalid_field_override(session, caplog) -> None:
     """Test field override with non-existent field."""
     faker = ModelFaker(MyModel, session)
     overrides = {
@@ -792,6 +1120,8 @@ def test_edge_case_invalid_field_override(session) -> None:
     # Should not raise error, just ignore the non-existent field
     instances = faker.create_with(overrides, amount=1)
     assert len(instances) == 1
+    assert instances[0].string_field == "test"
+    assert "non_existent_field" in caplog.text
 
 
 def test_edge_case_create_batch_zero(session) -> None:
@@ -825,10 +1155,10 @@ def test_edge_case_multiple_resets(session) -> None:
     assert deleted_count2 == 0
 
 
-def test_edge_case_context_manager_exception(session) -> None:
+def test_edge_case_context_manager_exception(session, isolated_base) -> None:
     """Test context manager with exception."""
 
-    class FailingModel(Base):
+    class FailingModel(isolated_base):
         __tablename__ = "failing_model"
         id = Column(Integer, primary_key=True)
         # This will cause issues with the test setup
@@ -842,15 +1172,35 @@ def test_edge_case_context_manager_exception(session) -> None:
         pass
 
 
-def test_edge_case_very_long_string_field(session) -> None:
+def test_length_limited_text_field(session, isolated_base) -> None:
+    """Test that Text columns respect their length."""
+
+    class LimitedTextModel(isolated_base):
+        __tablename__ = "limited_text_model"
+        id = Column(Integer, primary_key=True)
+        limited_text = Column(Text(20), nullable=False)
+        unlimited_text = Column(Text, nullable=False)
+
+    isolated_base.metadata.create_all(session.bind)
+
+    ModelFaker(LimitedTextModel, session).create(amount=5)
+
+    entries = session.query(LimitedTextModel).all()
+    assert len(entries) == 5
+    for entry in entries:
+        assert len(entry.limited_text) <= 20
+        assert len(entry.unlimited_text) <= 500
+
+
+def test_edge_case_very_long_string_field(session, isolated_base) -> None:
     """Test with very long string length."""
 
-    class LongStringModel(Base):
+    class LongStringModel(isolated_base):
         __tablename__ = "long_string_model"
         id = Column(Integer, primary_key=True)
         very_long_field = Column(String(10000), nullable=False)
 
-    Base.metadata.create_all(session.bind)
+    isolated_base.metadata.create_all(session.bind)
 
     faker = ModelFaker(LongStringModel, session)
     faker.create(amount=1)
@@ -875,6 +1225,22 @@ def test_edge_case_custom_faker_instance(session) -> None:
     assert len(entries) == 1
 
 
+@requires_multi_locale_faker
+def test_edge_case_multiple_locales_faker_instance(session) -> None:
+    """Test with a custom Faker instance of multiple locales."""
+    config = ModelFakerConfig(
+        faker_instance=Faker(["en_US", "de_DE"]), smart_detection=False
+    )
+    ModelFaker(MyModel, session, config=config).create(amount=3)
+
+    entries = session.query(MyModel).all()
+    assert len(entries) == 3
+    for entry in entries:
+        assert isinstance(entry.date_field, date)
+        assert isinstance(entry.datetime_field, datetime)
+        assert 100 <= entry.max_min_integer_field <= 101
+
+
 def test_edge_case_mixed_configurations(session) -> None:
     """Test mixed configuration options."""
 
@@ -932,19 +1298,21 @@ def test_edge_case_field_override_callable_error(session) -> None:
 
     faker = ModelFaker(MyModel, session, config=config)
 
-    with pytest.raises(RuntimeError, match="Failed to commit"):
+    with pytest.raises(RuntimeError, match="Failed to commit") as exc_info:
         faker.create(amount=1)
 
+    assert isinstance(exc_info.value.__cause__, ValueError)
 
-def test_edge_case_extremely_large_integer_range(session) -> None:
+
+def test_edge_case_extremely_large_integer_range(session, isolated_base) -> None:
     """Test with extremely large integer ranges."""
 
-    class LargeIntModel(Base):
+    class LargeIntModel(isolated_base):
         __tablename__ = "large_int_model"
         id = Column(Integer, primary_key=True)
         large_int = Column(Integer, nullable=False, info={"min": 1000000, "max": 9999999})
 
-    Base.metadata.create_all(session.bind)
+    isolated_base.metadata.create_all(session.bind)
 
     faker = ModelFaker(LargeIntModel, session)
     faker.create(amount=1)